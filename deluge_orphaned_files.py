@@ -2,12 +2,15 @@ import os
 import json
 from pathlib import Path
 from datetime import datetime
-from deluge_client import DelugeRPCClient
 from dotenv import load_dotenv
 import hashlib
 from tqdm import tqdm
 import argparse
 import logging
+import queue
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
 
 # Configure logging
 logging.basicConfig(
@@ -34,11 +37,33 @@ LOCAL_MEDIA_BASE_LOCAL_FOLDER = os.getenv("LOCAL_MEDIA_BASE_LOCAL_FOLDER")
 OUTPUT_FILE = os.getenv("OUTPUT_FILE")
 
 # List of file extensions and folders to ignore (comma-separated in .env file)
-EXTENSIONS_BLACKLIST = os.getenv('EXTENSIONS_BLACKLIST', '.nfo,.srt,.jpg').split(',')
-LOCAL_SUBFOLDERS_BLACKLIST = os.getenv("LOCAL_SUBFOLDERS_BLACKLIST", "music,ebooks,courses").split(',')
+EXTENSIONS_BLACKLIST = frozenset(os.getenv('EXTENSIONS_BLACKLIST', '.nfo,.srt,.jpg').split(','))
+LOCAL_SUBFOLDERS_BLACKLIST = frozenset(os.getenv("LOCAL_SUBFOLDERS_BLACKLIST", "music,ebooks,courses").split(','))
 CACHE_SAVE_INTERVAL = int(os.getenv("CACHE_SAVE_INTERVAL", 25))
 
-__version__ = "1.1.1"
+# Sample files and bonus material are never matched between folders
+SKIPPED_PATH_PATTERNS = (
+    '/sample',
+    '/featurettes',
+    '/extras',
+    '.sample',
+    '-sample'
+)
+
+# Hash cache files kept at the root of each scanned folder. New hashes are appended
+# to the journal during a scan and folded into the JSON snapshot when it ends.
+HASH_CACHE_FILENAME = '.hash_cache.json'
+HASH_CACHE_JOURNAL_FILENAME = '.hash_cache.journal'
+HASH_CACHE_FILENAMES = frozenset([
+    HASH_CACHE_FILENAME,
+    HASH_CACHE_JOURNAL_FILENAME,
+    HASH_CACHE_FILENAME + '.tmp'
+])
+
+# Allow for 2 second difference between cached and current mtimes
+MTIME_TOLERANCE_NS = 2_000_000_000
+
+__version__ = "2.0.0"
 
 def print_version_info():
     logger.info(f"Deluge Orphaned Files Checker v{__version__}")
@@ -55,11 +80,17 @@ def verify_paths():
             logger.error(f"{name} environment variable is not set")
             return False
 
-        if not os.path.exists(path):
+        # One stat call answers both "does it exist" and "is it a directory"
+        try:
+            path_stat = os.stat(path)
+        except FileNotFoundError:
             logger.error(f"{name} path does not exist: {path}")
             return False
+        except OSError as e:
+            logger.error(f"Error accessing {name} ({path}): {str(e)}")
+            return False
 
-        if not os.path.isdir(path):
+        if not stat.S_ISDIR(path_stat.st_mode):
             logger.error(f"{name} is not a directory: {path}")
             return False
 
@@ -80,31 +111,34 @@ def verify_paths():
 
 
     # Helper function to check if file should be processed
-def should_process_file(filepath: Path) -> bool:
+def should_process_file(filepath: str) -> bool:
+    filename = os.path.basename(filepath)
+
     # Check both the suffix and the full filename
-    if (filepath.suffix.lower() in EXTENSIONS_BLACKLIST or
-        filepath.name in EXTENSIONS_BLACKLIST):
+    if (os.path.splitext(filename)[1].lower() in EXTENSIONS_BLACKLIST or
+        filename in EXTENSIONS_BLACKLIST):
         return False
 
     # Check for sample files and featurettes
-    path_lower = str(filepath).lower()
-    if any(pattern in path_lower for pattern in [
-        '/sample',
-        '/featurettes',
-        '/extras',
-        '.sample',
-        '-sample'
-    ]):
+    path_lower = filepath.lower()
+    if any(pattern in path_lower for pattern in SKIPPED_PATH_PATTERNS):
         return False
 
     return True
 
 def get_deluge_files():
+    # Imported here so --help and path verification don't pay for the RPC stack
+    from deluge_client import DelugeRPCClient
+
     client = DelugeRPCClient(DELUGE_HOST, DELUGE_PORT, DELUGE_USERNAME, DELUGE_PASSWORD)
     client.connect()
 
-    logger.info(f"Fetching torrent list from {client.username}@{client.host}:{client.port}...")
-    torrent_list = client.call('core.get_torrents_status', {}, ['files', 'save_path', 'label'])
+    # The torrent list is all we need, don't hold the daemon session open for the whole scan
+    try:
+        logger.info(f"Fetching torrent list from {client.username}@{client.host}:{client.port}...")
+        torrent_list = client.call('core.get_torrents_status', {}, ['files', 'save_path', 'label'])
+    finally:
+        client.disconnect()
 
     all_files = set()
     file_labels = {}
@@ -122,112 +156,344 @@ def get_deluge_files():
 
 def load_hash_cache(cache_file):
     logger.info(f"Loading cache from: {cache_file}")
-    if os.path.exists(cache_file):
-        try:
-            with open(cache_file, 'r') as f:
-                cache = json.load(f)
-            logger.info(f"Loaded {len(cache)} cache entries")
-            logger.debug(f"Cache: {str(cache)[:400]}...")
-            return cache
-        except Exception as e:
-            logger.error(f"Error loading cache: {str(e)}")
-    else:
+    cache = {}
+    try:
+        with open(cache_file, 'r') as f:
+            cache = json.load(f)
+        logger.info(f"Loaded {len(cache)} cache entries")
+    except FileNotFoundError:
         logger.warning("Cache file not found")
-    return {}
+    except Exception as e:
+        logger.error(f"Error loading cache: {str(e)}")
+
+    # Entries hashed by a scan that stopped before its final save are still in the journal
+    journal_file = cache_file.with_name(HASH_CACHE_JOURNAL_FILENAME)
+    try:
+        replayed = replay_hash_cache_journal(journal_file, cache)
+        logger.info(f"Replayed {replayed} entries from cache journal")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.error(f"Error replaying cache journal: {str(e)}")
+
+    # str() of a large cache is expensive, only build it when it will be logged
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Cache: {str(cache)[:400]}...")
+    return cache
+
+def replay_hash_cache_journal(journal_file, hash_cache):
+    """Apply the [relative_path, entry] lines of a cache journal to hash_cache."""
+    replayed = 0
+    complete_size = 0
+    with open(journal_file, 'rb') as f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                # The last line is cut short if the scan was killed mid-write
+                logger.warning(f"Skipping truncated cache journal line in {journal_file}")
+                break
+            complete_size += len(line)
+            try:
+                relative_path, entry = json.loads(line)
+            except ValueError:
+                logger.warning(f"Skipping invalid cache journal line in {journal_file}")
+                continue
+            hash_cache[relative_path] = entry
+            replayed += 1
+
+    # Drop the partial line, otherwise the next append would be written onto its end
+    if complete_size < os.path.getsize(journal_file):
+        os.truncate(journal_file, complete_size)
+    return replayed
 
 def save_hash_cache(cache_file, hash_cache):
     logger.debug(f"Saving {len(hash_cache)} entries to hash cache")
+    # Write a temporary file and swap it in so an interrupted save can't corrupt the cache
+    tmp_file = cache_file.with_name(cache_file.name + '.tmp')
     try:
-        with open(cache_file, 'w') as f:
+        with open(tmp_file, 'w') as f:
             json.dump(hash_cache, f)
+        os.replace(tmp_file, cache_file)
+        # Everything the journal held is now part of the snapshot
+        cache_file.with_name(HASH_CACHE_JOURNAL_FILENAME).unlink(missing_ok=True)
     except Exception as e:
         logger.error(f"Error saving cache: {str(e)}")
 
-def get_local_files(folder):
-    local_files = {}
-    cache_file = Path(folder) / '.hash_cache.json'
-    hash_cache = load_hash_cache(cache_file)
+def open_hash_cache_journal(cache_file):
+    """Open the append-only journal that records new hashes during a scan."""
+    try:
+        return open(cache_file.with_name(HASH_CACHE_JOURNAL_FILENAME), 'a', buffering=1024 * 1024)
+    except OSError as e:
+        logger.error(f"Error opening cache journal, new hashes will only be saved at the end of the scan: {str(e)}")
+        return None
 
-    # First, count total files for the progress bar
-    total_files = 0
-    for root, dirs, files in os.walk(folder):
-        # Check if this is a blacklisted first-level subdirectory
-        relative_root = Path(root).relative_to(folder)
-        if relative_root.parts and relative_root.parts[0] in LOCAL_SUBFOLDERS_BLACKLIST:
+def flush_hash_cache_journal(journal):
+    try:
+        journal.flush()
+    except OSError as e:
+        logger.error(f"Error writing cache journal: {str(e)}")
+
+def store_file_hash(relative_path, file_size, mtime_ns, file_hash, hash_cache, local_files, journal):
+    """Record a new hash in the cache, its journal and the scan results."""
+    cache_entry = {
+        'hash': file_hash,
+        # Float seconds are kept so older versions can still read the cache
+        'mtime': mtime_ns / 1_000_000_000,
+        'mtime_ns': mtime_ns,
+        'size': file_size
+    }
+    hash_cache[relative_path] = cache_entry
+    if journal:
+        journal.write(json.dumps([relative_path, cache_entry]) + '\n')
+    local_files[relative_path] = {'hash': file_hash, 'size': file_size}
+
+def store_hash_results(done, pending, hash_cache, local_files, journal):
+    """Record finished hash jobs and return how many were handled."""
+    for future in done:
+        relative_path, file_size, mtime_ns = pending.pop(future)
+        try:
+            file_hash = future.result()
+        except OSError as e:
+            # The walk can run well ahead of hashing, the file may have been moved since
+            logger.warning(f"Could not hash {relative_path}: {str(e)}")
+            continue
+        store_file_hash(relative_path, file_size, mtime_ns, file_hash,
+                        hash_cache, local_files, journal)
+    return len(done)
+
+def walk_folder(folder):
+    """Yield (DirEntry, relative_path) for every non-directory entry under folder.
+
+    Uses os.scandir so directories are told apart from files without extra stat
+    calls. Blacklisted first-level subfolders and our own cache files are skipped.
+    """
+    # Symlinked directories are skipped: neither yielded nor descended into
+    stack = [(folder, '')]
+    while stack:
+        current_dir, relative_dir = stack.pop()
+        try:
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if entry.is_symlink():
+                            continue
+                        # Check if this is a blacklisted first-level subdirectory
+                        if not relative_dir and entry.name in LOCAL_SUBFOLDERS_BLACKLIST:
+                            continue
+                        stack.append((entry.path, relative_dir + entry.name + os.sep))
+                        continue
+
+                    # Never hash our own cache files, the journal changes while we scan
+                    if not relative_dir and entry.name in HASH_CACHE_FILENAMES:
+                        continue
+
+                    yield entry, relative_dir + entry.name
+        except OSError as e:
+            logger.warning(f"Could not read directory {current_dir}: {str(e)}")
+
+def scan_folder(folder):
+    """Yield (full_path, relative_path, size, mtime_ns) for each file that should be processed.
+
+    Each file costs a single stat call, made only once it has passed the name filters.
+    """
+    for entry, relative_path in walk_folder(folder):
+        if not should_process_file(entry.path):
             continue
-        total_files += sum(1 for f in files if should_process_file(Path(os.path.join(root, f))))
-
-    files_since_last_save = 0
-    with tqdm(total=total_files, desc=f"Scanning {Path(folder).name}") as pbar:
-        for root, dirs, files in os.walk(folder):
-            # Check if this is a blacklisted first-level subdirectory
-            relative_root = Path(root).relative_to(folder)
-            if relative_root.parts and relative_root.parts[0] in LOCAL_SUBFOLDERS_BLACKLIST:
-                continue
 
-            for file in files:
-                full_path = os.path.join(root, file)
-                if not should_process_file(Path(full_path)):
-                    continue
+        try:
+            stat_result = entry.stat()
+        except OSError as e:
+            logger.warning(f"Could not stat {entry.path}: {str(e)}")
+            continue
+        # Skip sockets, FIFOs and devices; reading a FIFO would block the scan
+        if not stat.S_ISREG(stat_result.st_mode):
+            continue
+        yield entry.path, relative_path, stat_result.st_size, stat_result.st_mtime_ns
 
-                relative_path = os.path.relpath(full_path, folder)
-                file_size = os.path.getsize(full_path)
+def queue_folder_files(folder, files_queue, errors):
+    """Feed scan_folder results into files_queue, followed by a None sentinel.
+
+    An exception raised by the walk is appended to errors so the consumer can
+    re-raise it instead of treating a partial walk as complete."""
+    try:
+        for file_info in scan_folder(folder):
+            files_queue.put(file_info)
+    except BaseException as e:
+        errors.append(e)
+    finally:
+        files_queue.put(None)
+
+def get_local_files(folder, jobs=1):
+    local_files = {}
+    cache_file = Path(folder) / HASH_CACHE_FILENAME
+    hash_cache = load_hash_cache(cache_file)
+    # Opened on the first cache miss, so scans that hash nothing never write to the folder
+    journal = None
+
+    # Walk the folder on a background thread so hashing starts while the walk is still running
+    files_queue = queue.Queue()
+    walker_errors = []
+    walker = threading.Thread(target=queue_folder_files, args=(folder, files_queue, walker_errors), daemon=True)
+    walker.start()
+
+    files_since_last_flush = 0
+    files_hashed = 0
+    files_seen = 0
+    # With more than one job, cache misses are hashed on a thread pool; hashlib
+    # releases the GIL while digesting
+    executor = ThreadPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    pending = {}
+    try:
+        # Cache hits take well under a microsecond, so limit redraws to twice a second
+        with tqdm(total=0, desc=f"Scanning {Path(folder).name}",
+                  mininterval=0.5, smoothing=0) as pbar:
+            while (file_info := files_queue.get()) is not None:
+                full_path, relative_path, file_size, mtime_ns = file_info
+                # The total grows as the walk discovers more files
+                files_seen += 1
+                pbar.total = files_seen + files_queue.qsize()
 
-                mtime = os.path.getmtime(full_path)
                 cache_key = relative_path
                 cache_hit = False
 
-                if cache_key in hash_cache:
-                    cached_mtime = float(hash_cache[cache_key]['mtime'])
-                    # Allow for 2 second difference
-                    if abs(cached_mtime - mtime) <= 2:
+                # One lookup per file; the entry is reused for the hit below
+                cached_entry = hash_cache.get(cache_key)
+                if cached_entry is not None:
+                    cached_mtime_ns = cached_entry.get('mtime_ns')
+                    if cached_mtime_ns is None:
+                        # Entries from older versions only have float seconds
+                        cached_mtime_ns = int(float(cached_entry['mtime']) * 1_000_000_000)
+                    # Entries written before sizes were cached only have an mtime
+                    cached_size = cached_entry.get('size', file_size)
+                    if abs(cached_mtime_ns - mtime_ns) <= MTIME_TOLERANCE_NS and cached_size == file_size:
                         cache_hit = True
                     else:
-                        logger.debug(f"Cache miss for {cache_key}: cached_mtime={cached_mtime}, current_mtime={mtime}")
+                        logger.debug("Cache miss for %s: cached_mtime_ns=%s, current_mtime_ns=%s, cached_size=%s, current_size=%s",
+                                     cache_key, cached_mtime_ns, mtime_ns, cached_size, file_size)
 
+                # Per-file messages use %-style arguments so nothing is formatted unless --debug is on
                 if cache_hit:
-                    file_hash = hash_cache[cache_key]['hash']
-                    logger.debug(f"Cache hit for {cache_key}")
+                    file_hash = cached_entry['hash']
+                    logger.debug("Cache hit for %s", cache_key)
+                    local_files[relative_path] = {'hash': file_hash, 'size': file_size}
+                    pbar.update(1)
+                    continue
+
+                logger.debug("Cache miss for %s", cache_key)
+                if files_hashed == 0:
+                    journal = open_hash_cache_journal(cache_file)
+                files_hashed += 1
+                if executor is None:
+                    # Hash on this thread so Ctrl-C stops the scan straight away
+                    try:
+                        file_hash = get_file_hash(full_path, file_size)
+                    except OSError as e:
+                        logger.warning(f"Could not hash {relative_path}: {str(e)}")
+                    else:
+                        store_file_hash(relative_path, file_size, mtime_ns, file_hash,
+                                        hash_cache, local_files, journal)
+                    handled = 1
                 else:
-                    logger.debug(f"Cache miss for {cache_key}")
-                    file_hash = get_file_hash(full_path)
-                    hash_cache[cache_key] = {
-                        'hash': file_hash,
-                        'mtime': mtime
-                    }
-                    files_since_last_save += 1
-
-                # Save cache every interval of new/modified files
-                if files_since_last_save >= CACHE_SAVE_INTERVAL:
-                    save_hash_cache(cache_file, hash_cache)
-                    files_since_last_save = 0
-                    logger.debug(f"Cache write, {len(hash_cache)} total cache entries")
-
-                local_files[relative_path] = {'hash': file_hash, 'size': file_size}
-                pbar.update(1)
-
-    # Final save of the cache
-    if files_since_last_save > 0:
+                    future = executor.submit(get_file_hash, full_path, file_size)
+                    pending[future] = (relative_path, file_size, mtime_ns)
+                    # Only a couple of files are queued per worker, so few hashes are
+                    # thrown away when the scan is interrupted
+                    if len(pending) < jobs * 2:
+                        continue
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    handled = store_hash_results(done, pending, hash_cache, local_files, journal)
+                pbar.update(handled)
+
+                # Flush the journal every interval of new/modified files so an interrupted
+                # scan keeps its progress, without rewriting the whole cache each time
+                files_since_last_flush += handled
+                if journal and files_since_last_flush >= CACHE_SAVE_INTERVAL:
+                    flush_hash_cache_journal(journal)
+                    files_since_last_flush = 0
+                    logger.debug(f"Cache journal flush, {len(hash_cache)} total cache entries")
+
+            # The walk is finished, so the total is now exact
+            walker.join()
+            pbar.total = files_seen
+            pbar.refresh()
+
+            # Drain whatever is still being hashed, the journal is flushed when it is closed
+            for future in as_completed(list(pending)):
+                pbar.update(store_hash_results([future], pending, hash_cache, local_files, journal))
+
+            # A failed walk only listed part of the folder; hashes stored above stay
+            # in the journal for the next run, but the partial result is not returned
+            if walker_errors:
+                raise walker_errors[0]
+    except BaseException:
+        if executor:
+            # Don't wait for queued hashes, but keep the ones that already finished
+            executor.shutdown(wait=False, cancel_futures=True)
+            finished = [future for future in pending if future.done() and not future.cancelled()]
+            store_hash_results(finished, pending, hash_cache, local_files, journal)
+        raise
+    else:
+        if executor:
+            executor.shutdown()
+    finally:
+        if journal:
+            journal.close()
+
+    # Fold the journal (including entries replayed from an earlier, interrupted scan)
+    # into a fresh snapshot, which also removes the journal
+    journal_file = cache_file.with_name(HASH_CACHE_JOURNAL_FILENAME)
+    try:
+        journal_size = os.path.getsize(journal_file)
+    except OSError:
+        journal_size = None
+    if files_hashed > 0 or journal_size:
         save_hash_cache(cache_file, hash_cache)
+    elif journal_size == 0:
+        # An empty journal replayed from an earlier scan has nothing to fold in
+        try:
+            journal_file.unlink()
+        except OSError as e:
+            logger.error(f"Error removing cache journal: {str(e)}")
     return local_files
 
-def get_file_hash(file_path):
+def get_file_hash(file_path, file_size=None):
     md5_hash = hashlib.md5()
-    file_size = os.path.getsize(file_path)
+    # Callers that already stat'ed the file pass its size to avoid another stat call
+    if file_size is None:
+        file_size = os.path.getsize(file_path)
 
     # Use a larger chunk size for better performance with large files
     chunk_size = 1024 * 1024  # 1MB chunks instead of 8KB
 
     with open(file_path, "rb") as f:
-        with tqdm(total=file_size, unit='B', unit_scale=True,
-                 desc=f"Hashing {Path(file_path).name}",
+        # Small files (subtitles, artwork, ...) fit in one chunk: hash them in a single
+        # read and skip setting up a progress bar that would only flicker. The read is
+        # bounded in case the file grew since it was stat'ed; if it did, the rest is
+        # hashed in chunks below
+        bytes_hashed = 0
+        if file_size <= chunk_size:
+            data = f.read(chunk_size + 1)
+            md5_hash.update(data)
+            if len(data) <= chunk_size:
+                return md5_hash.hexdigest()
+            bytes_hashed = len(data)
+
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        with tqdm(total=max(file_size, bytes_hashed), initial=bytes_hashed, unit='B', unit_scale=True,
+                 desc=f"Hashing {os.path.basename(file_path)}",
                  leave=False) as pbar:
-            while chunk := f.read(chunk_size):
-                md5_hash.update(chunk)
-                pbar.update(len(chunk))
+            while bytes_read := f.readinto(buffer):
+                md5_hash.update(view[:bytes_read])
+                pbar.update(bytes_read)
     return md5_hash.hexdigest()
 
-def find_orphaned_files(skip_media_check=False):
+def format_size(size: int) -> str:
+    """Format a byte count as GB, or MB below one GB, for the scan results."""
+    if size >= 1024**3:
+        return f"{size / (1024**3):.2f} GB"
+    return f"{size / (1024**2):.2f} MB"
+
+def find_orphaned_files(skip_media_check=False, jobs=1):
     scan_start_time = datetime.now()
     try:
         logger.info("Connecting to Deluge and getting file list...")
@@ -235,49 +501,42 @@ def find_orphaned_files(skip_media_check=False):
         logger.info(f"Found {len(deluge_files)} files in Deluge.")
 
         logger.info("Scanning local torrent folder...")
-        local_torrent_files = get_local_files(LOCAL_TORRENT_BASE_LOCAL_FOLDER)
+        local_torrent_files = get_local_files(LOCAL_TORRENT_BASE_LOCAL_FOLDER, jobs)
         logger.info(f"Found {len(local_torrent_files)} files in local torrent folder.")
 
+        logger.info("Comparing files in deluge against files in the local torrent folder...")
         # Get orphaned files with their sizes
         orphaned_torrent_files = [
             {
                 "path": path,
                 "size": info['size'],
-                "size_human": f"{info['size'] / (1024**3):.2f} GB" if info['size'] >= 1024**3 else
-                            f"{info['size'] / (1024**2):.2f} MB"
+                "size_human": format_size(info['size'])
             }
             for path, info in local_torrent_files.items()
             if path not in deluge_files
         ]
         # Sort by size
         orphaned_torrent_files.sort(key=lambda x: x["size"], reverse=True)
-
-        logger.info("Comparing files in deluge against files in the local torrent folder...")
-        orphaned_torrent_files = sorted(list(set(local_torrent_files.keys()) - deluge_files))
         logger.info(f"Found {len(orphaned_torrent_files)} files in the local torrent folder that are not in Deluge.")
 
         if skip_media_check:
             if orphaned_torrent_files:
                 logger.info(f"\nFound {len(orphaned_torrent_files)} orphans")
-                save_scan_results(orphaned_torrent_files, [], [])
+                save_scan_results(orphaned_torrent_files, [], [], scan_start_time)
             else:
                 logger.info("\nNo orphaned files found.")
             return
 
         logger.info("Scanning local media folder...")
-        local_media_files = get_local_files(LOCAL_MEDIA_BASE_LOCAL_FOLDER)
+        local_media_files = get_local_files(LOCAL_MEDIA_BASE_LOCAL_FOLDER, jobs)
         logger.info(f"Found {len(local_media_files)} files in local media folder.")
 
         # Compare files based on their hashes
-        # Exclude files in blacklisted subfolders and with blacklisted extensions
+        # Blacklisted subfolders and extensions were already skipped while scanning
         torrent_hashes = {info['hash']: (name, info['size'], file_labels.get(name, "none"))
-                         for name, info in local_torrent_files.items()
-                         if not any(name.startswith(subfolder + '/')
-                                  for subfolder in LOCAL_SUBFOLDERS_BLACKLIST)}
+                         for name, info in local_torrent_files.items()}
         media_hashes = {info['hash']: (name, info['size'])
-                       for name, info in local_media_files.items()
-                       if not any(name.startswith(subfolder + '/')
-                                for subfolder in LOCAL_SUBFOLDERS_BLACKLIST)}
+                       for name, info in local_media_files.items()}
 
         # Pre-filter collections before set operations
         torrent_set = frozenset(torrent_hashes.keys())
@@ -287,25 +546,23 @@ def find_orphaned_files(skip_media_check=False):
         # Get files only in torrents with sizes
         only_in_torrents = [
             {
-                "path": torrent_hashes[hash][0],
-                "label": torrent_hashes[hash][2],
-                "size": torrent_hashes[hash][1],
-                "size_human": f"{torrent_hashes[hash][1] / (1024**3):.2f} GB" if torrent_hashes[hash][1] >= 1024**3 else
-                            f"{torrent_hashes[hash][1] / (1024**2):.2f} MB"
+                "path": path,
+                "label": label,
+                "size": size,
+                "size_human": format_size(size)
             }
-            for hash in torrent_set - media_set
+            for path, size, label in (torrent_hashes[hash] for hash in torrent_set - media_set)
         ]
         only_in_torrents.sort(key=lambda x: ("a" if x["label"].startswith("other") else x["label"], x["size"]), reverse=True)
 
         # Get files only in media with sizes
         only_in_media = [
             {
-                "path": media_hashes[hash][0],
-                "size": media_hashes[hash][1],
-                "size_human": f"{media_hashes[hash][1] / (1024**3):.2f} GB" if media_hashes[hash][1] >= 1024**3 else
-                            f"{media_hashes[hash][1] / (1024**2):.2f} MB"
+                "path": path,
+                "size": size,
+                "size_human": format_size(size)
             }
-            for hash in media_set - torrent_set
+            for path, size in (media_hashes[hash] for hash in media_set - torrent_set)
         ]
         only_in_media.sort(key=lambda x: x["size"], reverse=True)
 
@@ -318,9 +575,9 @@ def find_orphaned_files(skip_media_check=False):
         return
 
 def save_scan_results(
-    orphaned_torrent_files: list[str],
-    only_in_torrents: list[str],
-    only_in_media: list[str],
+    orphaned_torrent_files: list[dict],
+    only_in_torrents: list[dict],
+    only_in_media: list[dict],
     scan_start_time: datetime
 ) -> None:
     output_data = {
@@ -341,17 +598,13 @@ def save_scan_results(
         logger.error(f"Failed to save scan results to {OUTPUT_FILE}: {e}")
 
 def clean_hash_cache(folder: Path) -> None:
-    cache_file = folder / '.hash_cache.json'
+    cache_file = folder / HASH_CACHE_FILENAME
     hash_cache = load_hash_cache(cache_file)
 
-    current_files = set()
-    for root, _, files in os.walk(folder):
-        for file in files:
-            full_path = os.path.join(root, file)
-            relative_path = os.path.relpath(full_path, folder)
-            current_files.add(relative_path)
+    # Only names are needed here, so walk without stat'ing any files
+    current_files = {relative_path for _, relative_path in walk_folder(folder)}
 
-    # Remove entries for files that no longer exist
+    # Remove entries for files that no longer exist or live in blacklisted subfolders
     updated_cache = {k: v for k, v in hash_cache.items() if k in current_files}
 
     # Save cleaned cache
@@ -371,8 +624,13 @@ def main():
                        help='Enable debug logging')
     parser.add_argument('--skip-media-check', action='store_true',
                        help='Only check Deluge vs local torrent files (skip media folder comparison)')
+    parser.add_argument('--jobs', type=int, default=1,
+                       help='Number of files to hash in parallel (default: 1)')
     args = parser.parse_args()
 
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
     if args.debug:
         logger.setLevel(logging.DEBUG)
 
@@ -386,7 +644,7 @@ def main():
         clean_hash_cache(Path(LOCAL_TORRENT_BASE_LOCAL_FOLDER))
         clean_hash_cache(Path(LOCAL_MEDIA_BASE_LOCAL_FOLDER))
 
-    find_orphaned_files(skip_media_check=args.skip_media_check)
+    find_orphaned_files(skip_media_check=args.skip_media_check, jobs=args.jobs)
 
 if __name__ == "__main__":
     main()